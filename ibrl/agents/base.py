@@ -24,6 +24,7 @@ class BaseAgent(ABC):
         assert isinstance(num_actions,int) and num_actions >= 2
         self.num_actions = num_actions
         self.seed = seed
+        self.seed_sequence = np.random.SeedSequence(seed)  # spawns an independent random number stream for each run
         self.verbose = verbose
 
     @abstractmethod
@@ -51,5 +52,4 @@ class BaseAgent(ABC):
         Called before interacting with a new environment
         """
         self.step = 1
-        self.seed += 1
-        self.random = np.random.default_rng(seed = self.seed)
+        self.random = np.random.default_rng(self.seed_sequence.spawn(1)[0])
@@ -46,15 +46,15 @@ class BaseGreedyAgent(BaseAgent):
         raise RuntimeError("Invalid state")
 
     def build_epsilon_greedy_policy(self, values : NDArray[np.float64]) -> NDArray[np.float64]:
+        epsilon = self.parse_parameter(self.epsilon)
+
         # Exploitation: sample uniformly across actions with highest value
         best_actions = (values == values.max())
-        exploit = np.ones_like(values)*best_actions / best_actions.sum()
+        policy = best_actions * ((1 - epsilon) / np.count_nonzero(best_actions))
 
         # Exploration: sample uniformly across all actions
-        explore = np.ones_like(values) / self.num_actions
-
-        epsilon = self.parse_parameter(self.epsilon)
-        return (1 - epsilon) * exploit + epsilon * explore
+        policy += epsilon / self.num_actions
+        return policy
 
     def build_softmax_policy(self, values : NDArray[np.float64]) -> NDArray[np.float64]:
         temperature = self.parse_parameter(self.temperature)
@@ -12,6 +12,11 @@ class BayesianAgent(BaseGreedyAgent):
     Update this estimate at each iteration based on the observed information.
     Picks the action with the largest expected reward.
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.values = np.zeros(self.num_actions)
+        self.precision = np.zeros(self.num_actions)
+
     def get_probabilities(self) -> NDArray[np.float64]:
         return self.build_greedy_policy(self.values)
 
@@ -19,10 +24,11 @@ class BayesianAgent(BaseGreedyAgent):
         super().update(probabilities, action, reward)
         # Estimate reward of the action and its uncertainty based on observed reward and priors
         # Define precision, tau, as 1/sigma^2 to avoid vanishing sigma precision issues
-        self.values[action] = (self.precision[action] * self.values[action] + reward) / (self.precision[action] + 1.0)
+        # The posterior mean is the precision-weighted average of prior mean and reward, written as an incremental update
         self.precision[action] += 1
+        self.values[action] += (reward - self.values[action]) / self.precision[action]
 
     def reset(self):
         super().reset()
-        self.values = np.zeros(self.num_actions)
-        self.precision = np.ones(self.num_actions) * 0.1
+        self.values.fill(0)
+        self.precision.fill(0.1)
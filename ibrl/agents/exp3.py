@@ -13,13 +13,16 @@ class EXP3Agent(BaseAgent):
         self.gamma = gamma
         self.max_reward = max_reward
         self.eta = gamma / self.num_actions
+        self.log_weights = np.zeros(self.num_actions)
+        self.probs = np.zeros(self.num_actions)
+        self.next_probs = np.zeros(self.num_actions)  # scratch buffer, swapped with probs after each update
 
     def reset(self):
         super().reset()
         # We store weights in log-space for numerical stability
         # log(1.0) = 0
-        self.log_weights = np.zeros(self.num_actions)
-        self.probs = np.ones(self.num_actions) / self.num_actions
+        self.log_weights.fill(0)
+        self.probs.fill(1 / self.num_actions)
 
     def get_probabilities(self):
         return self.probs
@@ -37,7 +40,12 @@ class EXP3Agent(BaseAgent):
         # 3. Update log-weights using the learning rate (eta)
         self.log_weights[action] += self.eta * estimated_reward
 
-        # 4. Numerically stable softmax
-        weights = np.exp(self.log_weights - np.max(self.log_weights))
-        self.probs = (1 - self.gamma) * (weights / np.sum(weights)) + (self.gamma / self.num_actions)
-        self.probs /= self.probs.sum()
+        # 4. Numerically stable softmax, mixed with uniform exploration
+        # Work in place on the scratch buffer; the mixture is normalised by construction
+        # The current policy must stay intact, as the caller may still hold it
+        weights = self.next_probs
+        np.subtract(self.log_weights, self.log_weights.max(), out=weights)
+        np.exp(weights, out=weights)
+        weights *= (1 - self.gamma) / weights.sum()
+        weights += self.gamma / self.num_actions
+        self.probs, self.next_probs = weights, self.probs
@@ -10,10 +10,23 @@ class ExperimentalAgent1(QLearningAgent):
     Instead of using the non-deterministic probability distribution from Q-learning, sample an action from it and
     return a deterministic distribution that chooses this action.
     Consequently, we only access the diagonal of the reward matrix.
+
+    The returned distribution is only valid until the next call to get_probabilities().
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.probabilities = np.zeros((self.num_actions,))
+
     def get_probabilities(self) -> NDArray[np.float64]:
         proto_probabilities = super().get_probabilities()
         action = sample_action(self.random, proto_probabilities)
-        probabilities = np.zeros((self.num_actions,))
-        probabilities[action] = 1
-        return probabilities
+        # Reuse the same buffer at every step: clear the previous peak and set the new one
+        self.probabilities[self.peak_action] = 0
+        self.probabilities[action] = 1
+        self.peak_action = action
+        return self.probabilities
+
+    def reset(self):
+        super().reset()
+        self.probabilities.fill(0)
+        self.peak_action = 0
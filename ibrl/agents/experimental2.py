@@ -27,11 +27,13 @@ class ExperimentalAgent2(BaseGreedyAgent):
         self.learning_rate = learning_rate
         self.update_threshold = 0.9 # minimum probability to be considered for update
         self.exploration_peak = 20  # how strongly peaked should exploration policies be
+        self.counts = np.zeros((self.num_actions,self.num_actions))
+        self.q = np.zeros((self.num_actions,self.num_actions))
 
     def get_probabilities(self) -> NDArray[np.float64]:
         epsilon = self.parse_parameter(self.epsilon)
 
-        if self.random.binomial(1, epsilon):
+        if self.random.random() < epsilon:
             # exploration: pick a strongly peaked distribution (with random peak)
             exploration = np.ones((self.num_actions,))
             exploration[self.random.integers(self.num_actions)] += self.exploration_peak
@@ -52,16 +54,18 @@ class ExperimentalAgent2(BaseGreedyAgent):
     def update(self, probabilities : NDArray[np.float64], action : int, reward : float):
         super().update(probabilities, action, reward)
         prediction = probabilities.argmax()
+        weight = probabilities[prediction]
         # only update action for which distribution is strongly peaked,
         # i.e. when we can be fairly certain that the predictor chose this action
-        if probabilities[prediction] < self.update_threshold:
+        if weight < self.update_threshold:
             return
         # updates are weighted by the corresponding probability
-        self.counts[prediction,action] += probabilities[prediction]
-        self.q[prediction,action] += probabilities[prediction] * (reward - self.q[prediction,action]) / self.counts[prediction,action]
+        entry = (prediction, action)
+        self.counts[entry] += weight
+        self.q[entry] += weight * (reward - self.q[entry]) / self.counts[entry]
         #self.q[prediction,action] += probabilities[prediction] * self.learning_rate * (reward - self.q[prediction,action])
 
     def reset(self):
         super().reset()
-        self.counts = np.zeros((self.num_actions,self.num_actions))
-        self.q = np.zeros((self.num_actions,self.num_actions))
+        self.counts.fill(0)
+        self.q.fill(0)
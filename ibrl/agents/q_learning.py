@@ -17,6 +17,7 @@ class QLearningAgent(BaseGreedyAgent):
         super().__init__(*args, **kwargs)
 
         self.learning_rate = learning_rate
+        self.q = np.zeros((self.num_actions,))
 
     def get_probabilities(self) -> NDArray[np.float64]:
         return self.build_greedy_policy(self.q)
@@ -27,4 +28,4 @@ class QLearningAgent(BaseGreedyAgent):
 
     def reset(self):
         super().reset()
-        self.q = np.zeros((self.num_actions,))
+        self.q.fill(0)
@@ -12,12 +12,27 @@ class BanditEnvironment(BaseEnvironment):
     according to a normal distribution centred on the average value.
     Upon initialisation, the average rewards are sampled from a standard normal distribution.
     """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Buffers are allocated once and refilled in place by reset()
+        self.rewards = np.empty((self.num_actions,))
+        self.noise = np.empty((self.num_steps,)) if self.num_steps is not None else None
+
     def interact(self, action : int) -> float:
-        return self.random.normal(self.rewards[action], 1)
+        # Use the pre-drawn noise while it lasts; episodes may run longer than the num_steps used for planning
+        if self.noise is None or self.step >= len(self.noise):
+            return self.rewards[action] + self.random.standard_normal()
+        z = self.noise[self.step]
+        self.step += 1
+        return self.rewards[action] + z
 
     def get_optimal_reward(self) -> int:
         return self.rewards.max()
 
     def reset(self):
         super().reset()
-        self.rewards = self.random.standard_normal((self.num_actions,))
+        self.step = 0
+        self.random.standard_normal(out=self.rewards)
+        # If the episode length is known, draw the noise for all steps at once
+        if self.noise is not None:
+            self.random.standard_normal(out=self.noise)
@@ -32,6 +32,7 @@ class BaseEnvironment(ABC):
         self.num_steps = num_steps
         self.num_runs = num_runs
         self.seed = seed
+        self.seed_sequence = np.random.SeedSequence(seed)  # spawns an independent random number stream for each run
         self.verbose = verbose
 
     def predict(self, probabilities : NDArray[np.float64]) -> None:
@@ -75,5 +76,4 @@ class BaseEnvironment(ABC):
         """
         Reset internal state. Potentially initialise randomly
         """
-        self.seed += 1
-        self.random = np.random.default_rng(seed = self.seed)
+        self.random = np.random.default_rng(self.seed_sequence.spawn(1)[0])
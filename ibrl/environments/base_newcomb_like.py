@@ -24,11 +24,10 @@ class BaseNewcombLikeEnvironment(BaseEnvironment):
         self.reward_table = np.array(reward_table)
 
     def predict(self, probabilities : NDArray[np.float64]):
-        prediction = sample_action(self.random, probabilities)
-        self.rewards = self.reward_table[prediction,:]
+        self.prediction = sample_action(self.random, probabilities)
 
     def interact(self, action : int) -> float:
-        return self.rewards[action]
+        return self.reward_table[self.prediction,action]
 
     def get_optimal_reward(self) -> int:
         # Compute the optimal reward, based on the full reward table
@@ -10,8 +10,8 @@ class PolicyDependentBanditEnvironment(BaseNewcombLikeEnvironment):
     This is a generalisation of both the multi-armed bandit and Newcomb-like problems
     """
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, reward_table=[[0,0],[0,0]], **kwargs)
+        super().__init__(*args, reward_table=[[0.,0.],[0.,0.]], **kwargs)
 
     def reset(self):
         super().reset()
-        self.reward_table = self.random.standard_normal((self.num_actions,self.num_actions))  # 2D array
+        self.random.standard_normal(out=self.reward_table)  # 2D array, refilled in place
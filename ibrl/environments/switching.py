@@ -18,13 +18,14 @@ class SwitchingAdversaryEnvironment(BaseEnvironment):
                 raise RuntimeError("SwitchingAdversaryEnvironment: require either switch_at or num_steps argument")
             switch_at = self.num_steps // 2
         self.switch_at = switch_at
+        self.values = np.zeros((self.num_actions,))
 
     def interact(self, action : int) -> float:
         self.step += 1
 
         # At switch_at, the 'best' arm moves to the other side
         if self.step == self.switch_at:
-            self.values = np.zeros((self.num_actions,))
+            self.values.fill(0)
             self.values[-1] = 1.0 # Move reward to the last arm
 
         return self.random.normal(self.values[action], 0.1)
@@ -36,5 +37,5 @@ class SwitchingAdversaryEnvironment(BaseEnvironment):
         super().reset()
         self.step = 0
         # Ensure Arm 0 is the best at the start
-        self.values = np.zeros((self.num_actions,))
+        self.values.fill(0)
         self.values[0] = 1.0
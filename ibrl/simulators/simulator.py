@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
 from ..agents import BaseAgent
@@ -18,6 +19,7 @@ def simulate(
         options: dictionary of further options, namely
             num_steps: Number of steps to simulate in each run
             num_runs:  Number of runs
+            num_jobs:  Number of worker processes among which the runs are distributed
             verbose:   Request debugging output
 
     Returns:
@@ -27,30 +29,82 @@ def simulate(
     """
     num_steps = options.get("num_steps", 101)
     num_runs = options.get("num_runs", 1)
+    num_jobs = options.get("num_jobs", 1)
     verbose = options.get("verbose", 0)
 
-    average_reward = np.zeros((2,num_steps)) # average reward, average (reward^2)
-    optimal_reward = 0
+    if num_jobs <= 1:
+        rewards, optimal_rewards = simulate_runs(env, agent, 0, num_runs, num_steps, verbose)
+    else:
+        # Runs are independent, so each worker simulates a contiguous block of them on its own copy of env and agent
+        bounds = np.linspace(0, num_runs, min(num_jobs, num_runs) + 1).astype(int)
+        with ProcessPoolExecutor(len(bounds) - 1) as executor:
+            futures = [
+                executor.submit(simulate_runs, env, agent, first_run, last_run - first_run, num_steps, verbose)
+                for first_run,last_run in zip(bounds[:-1], bounds[1:])
+            ]
+            results = [future.result() for future in futures]
+        rewards = np.concatenate([result[0] for result in results])
+        optimal_rewards = np.concatenate([result[1] for result in results])
+        # Leave env and agent in the same state as after a serial simulation
+        env.seed_sequence.spawn(num_runs)
+        agent.seed_sequence.spawn(num_runs)
+
+    # Reduce across runs in one go, rather than accumulating step by step
+    # Both rows are written in place; einsum sums the squares without materialising a (num_runs,num_steps) temporary
+    average_reward = np.empty((2,num_steps))  # average reward, average (reward^2)
+    rewards.mean(axis=0, out=average_reward[0])
+    np.einsum("rs,rs->s", rewards, rewards, out=average_reward[1])
+    average_reward[1] /= num_runs
+    optimal_reward = optimal_rewards.mean()  # reduced in run order, so independent of num_jobs
+
+    results = {
+        "average_reward": average_reward,
+        "optimal_reward": optimal_reward
+    }
+
+    return results
+
+
+def simulate_runs(
+        env : BaseEnvironment,
+        agent : BaseAgent,
+        first_run : int,
+        num_runs : int,
+        num_steps : int,
+        verbose : int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate a block of consecutive runs
+
+    Arguments:
+        env:       the environment
+        agent:     the agent
+        first_run: Index of the first run in the block, used to pick the random number streams for this block
+        num_runs:  Number of runs in the block
+        num_steps: Number of steps to simulate in each run
+        verbose:   Request debugging output
+
+    Returns:
+        A tuple consisting of:
+            a (num_runs,num_steps) array containing the reward received at each step of each run
+            a (num_runs,) array containing the optimal reward of each run
+    """
+    # Each reset spawns a new random number stream, so skip the streams used by earlier runs
+    env.seed_sequence.spawn(first_run)
+    agent.seed_sequence.spawn(first_run)
+
+    rewards = np.zeros((num_runs,num_steps))  # reward received at each step of each run
+    optimal_rewards = np.zeros((num_runs,))  # optimal reward of each run
 
     for r in range(num_runs):
         env.reset()
         agent.reset()
-        optimal_reward += env.get_optimal_reward()
+        optimal_rewards[r] = env.get_optimal_reward()
         for i in range(num_steps):
             probabilities = agent.get_probabilities()
             env.predict(probabilities)
             action = sample_action(agent.random, probabilities)
             reward = env.interact(action)
             agent.update(probabilities, action, reward)
-            average_reward[0,i] += reward
-            average_reward[1,i] += reward**2
-
-    average_reward /= num_runs
-    optimal_reward /= num_runs
+            rewards[r,i] = reward
 
-    results = {
-        "average_reward": average_reward,
-        "optimal_reward": optimal_reward
-    }
-
-    return results
+    return rewards, optimal_rewards
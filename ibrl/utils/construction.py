@@ -68,6 +68,7 @@ def construct_agent(string : str, options : dict[str,int], seed_offset : int = 0
     arguments.update(kwargs)
     arguments.pop("num_steps", None)  # These should not be accessible to the agent
     arguments.pop("num_runs", None)
+    arguments.pop("num_jobs", None)
     arguments["seed"] += seed_offset
     return agent_types[name](**arguments)
 
@@ -107,5 +108,6 @@ def construct_environment(string : str, options : dict[str,int], seed_offset : i
     arguments = dict()
     arguments.update(options)
     arguments.update(kwargs)
+    arguments.pop("num_jobs", None)  # Not relevant to the environment
     arguments["seed"] += seed_offset
     return environment_types[name](**arguments)
\ No newline at end of file
@@ -6,11 +6,23 @@ def sample_action(rng : np.random.Generator, policy: NDArray[np.float64]) -> int
     """
     Sample an action from a given policy
 
+    Equivalent to rng.choice(len(policy), p=policy), but skips the validation of the distribution, which dominates the
+    cost of drawing a single sample. Consumes the same random numbers as rng.choice.
+
     Arguments:
         policy: Probability distribution over actions
 
     Returns:
         index of action
     """
-    policy /= policy.sum()  # for numerics
-    return rng.choice(len(policy), p=policy)
+    if len(policy) == 2:
+        # Two actions (all Newcomb-like environments): same arithmetic on scalars, without array operations
+        p0, p1 = policy.tolist()
+        total = p0 + p1
+        p0, p1 = p0 / total, p1 / total
+        return int(rng.random() >= p0 / (p0 + p1))
+
+    cdf = policy / policy.sum()  # for numerics
+    np.cumsum(cdf, out=cdf)
+    cdf /= cdf[-1]
+    return int(cdf.searchsorted(rng.random(), side="right"))